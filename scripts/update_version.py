@@ -2,8 +2,15 @@
 import re
 import sys
 from pathlib import Path
-import tomli
-import tomli_w
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+_VERSION_RE = re.compile(r"^\d+\.\d+\.\d+$")
+_INIT_VERSION_RE = re.compile(rb"__version__\s*=\s*['\"]([^'\"]+)['\"]")
+_PYPROJECT_VERSION_RE = re.compile(rb'^version\s*=\s*"[^"]+"', re.MULTILINE)
 
 
 def update_version(init_file: str, pyproject_file: str, new_version: str) -> None:
@@ -21,15 +28,13 @@ def update_version(init_file: str, pyproject_file: str, new_version: str) -> Non
         print(f"Error: {init_file} does not exist")
         sys.exit(1)
 
-    content = init_file.read_text()
-    new_content = re.sub(
-        r"__version__\s*=\s*['\"]([^'\"]+)['\"]",
-        f'__version__ = "{new_version}"',
-        content,
+    content = init_file.read_bytes()
+    new_content = _INIT_VERSION_RE.sub(
+        f'__version__ = "{new_version}"'.encode(), content
     )
 
     if content != new_content:
-        init_file.write_text(new_content)
+        init_file.write_bytes(new_content)
         print(f"Updated version to {new_version} in {init_file}")
 
     # Update pyproject.toml
@@ -38,13 +43,18 @@ def update_version(init_file: str, pyproject_file: str, new_version: str) -> Non
         print(f"Error: {pyproject_file} does not exist")
         sys.exit(1)
 
-    with open(pyproject_file, "rb") as f:
-        data = tomli.load(f)
+    raw = pyproject_file.read_bytes()
+    data = tomllib.loads(raw.decode("utf-8"))
 
     if data["tool"]["poetry"]["version"] != new_version:
-        data["tool"]["poetry"]["version"] = new_version
-        with open(pyproject_file, "wb") as f:
-            tomli_w.dump(data, f)
+        # Rewrite only the version line so the rest of the file keeps its layout
+        new_raw, count = _PYPROJECT_VERSION_RE.subn(
+            f'version = "{new_version}"'.encode(), raw, count=1
+        )
+        if count == 0:
+            print(f"Error: could not find a version line in {pyproject_file}")
+            sys.exit(1)
+        pyproject_file.write_bytes(new_raw)
         print(f"Updated version to {new_version} in {pyproject_file}")
 
 
@@ -55,7 +65,7 @@ def main():
         sys.exit(1)
 
     new_version = sys.argv[1]
-    if not re.match(r"^\d+\.\d+\.\d+$", new_version):
+    if not _VERSION_RE.match(new_version):
         print("Error: Version must be in format X.Y.Z")
         sys.exit(1)
 
@@ -1,11 +1,13 @@
 from dataclasses import dataclass
 from functools import lru_cache
 from importlib import import_module
-from typing import Generator, Type, Any, Dict, Set
+from typing import Generator, Type, Any, Dict, FrozenSet, Optional, Tuple
 
 from django.conf import settings
 from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
 
 @dataclass(frozen=True)
@@ -15,6 +17,7 @@ class CacheConfig:
     enabled: bool = True
     timeout: int = 3600
     key_prefix: str = "uzbekistan"
+    health_check: bool = False
 
 
 class DynamicImportError(Exception):
@@ -29,6 +32,28 @@ class CacheIncorrectlyConfigured(Exception):
     pass
 
 
+# Precomputed class names for the built-in location items, so the URL-conf
+# load doesn't title-case the same names on every import.
+_CLASS_NAME_FOR: Dict[str, Dict[str, str]] = {
+    "views": {
+        "region": "RegionListAPIView",
+        "district": "DistrictListAPIView",
+        "village": "VillageListAPIView",
+    },
+    "models": {
+        "region": "Region",
+        "district": "District",
+        "village": "Village",
+    },
+}
+
+# Marks a setting that is absent from UZBEKISTAN
+_MISSING = object()
+
+# Location items in dependency order; other items sort after them by name.
+_ITEM_ORDER: Dict[str, int] = {"region": 0, "district": 1, "village": 2}
+
+
 class DynamicImporter:
     """
     Dynamic importer for the package.
@@ -40,11 +65,16 @@ class DynamicImporter:
     # Class-level cache for imported modules
     _module_cache: Dict[str, Any] = {}
 
-    @staticmethod
-    def get_setting(setting_name: str, default: Any = None) -> Any:
+    # Class-level cache for resolved UZBEKISTAN settings
+    _settings_cache: Dict[str, Any] = {}
+
+    @classmethod
+    def get_setting(cls, setting_name: str, default: Any = None) -> Any:
         """
         Get a setting from UZBEKISTAN settings with proper error handling.
 
+        Looked-up values are cached until the UZBEKISTAN setting changes.
+
         Args:
             setting_name: Name of the setting to get
             default: Default value if setting doesn't exist
@@ -55,11 +85,15 @@ class DynamicImporter:
         Raises:
             ImproperlyConfigured: If UZBEKISTAN setting is not configured
         """
-        if not hasattr(settings, "UZBEKISTAN") or settings.UZBEKISTAN is None:
-            raise ImproperlyConfigured(
-                "The UZBEKISTAN setting is required. Please add it to your settings.py file."
-            )
-        return settings.UZBEKISTAN.get(setting_name, default)
+        value = cls._settings_cache.get(setting_name, _MISSING)
+        if value is _MISSING:
+            if not hasattr(settings, "UZBEKISTAN") or settings.UZBEKISTAN is None:
+                raise ImproperlyConfigured(
+                    "The UZBEKISTAN setting is required. Please add it to your settings.py file."
+                )
+            value = settings.UZBEKISTAN.get(setting_name, _MISSING)
+            cls._settings_cache[setting_name] = value
+        return default if value is _MISSING else value
 
     @classmethod
     @lru_cache(maxsize=1)
@@ -76,8 +110,8 @@ class DynamicImporter:
         return CacheConfig(**cache_settings)
 
     @classmethod
-    @lru_cache(maxsize=1)
-    def get_enabled_items(cls, item_type: str) -> Set[str]:
+    @lru_cache(maxsize=None)
+    def get_enabled_items(cls, item_type: str) -> FrozenSet[str]:
         """
         Get a set of enabled items (models/views) from settings.
 
@@ -85,22 +119,25 @@ class DynamicImporter:
             item_type: Type of items ('models' or 'views')
 
         Returns:
-            Set of enabled item names
+            Frozen set of enabled item names, safe to share between callers
         """
         items = cls.get_setting(item_type, {})
-        return {name.lower() for name, enabled in items.items() if enabled}
+        return frozenset(name.lower() for name, enabled in items.items() if enabled)
 
     @classmethod
     def validate_cache(cls) -> None:
         """
         Validate cache configuration and functionality.
 
+        The live set/get/delete round-trip only runs when the ``health_check``
+        cache option is enabled, so validation does no cache I/O by default.
+
         Raises:
             CacheIncorrectlyConfigured: If cache is not working properly
         """
         cache_config = cls.get_cache_config()
 
-        if not cache_config.enabled:
+        if not cache_config.enabled or not cache_config.health_check:
             return
 
         try:
@@ -152,13 +189,16 @@ class DynamicImporter:
         Returns:
             Generated class name
         """
-        if class_type == "views":
-            return f"{item_name.title()}ListAPIView"
-        elif class_type == "models":
-            return item_name.title()
-        else:
+        if class_type not in _CLASS_NAME_FOR:
             raise ValueError(f"Invalid class_type: {class_type}")
 
+        class_name = _CLASS_NAME_FOR[class_type].get(item_name)
+        if class_name is not None:
+            return class_name
+
+        suffix = "ListAPIView" if class_type == "views" else ""
+        return f"{item_name.title()}{suffix}"
+
     @classmethod
     def validate_class(cls, class_obj: Type[Any], class_type: str) -> bool:
         """
@@ -180,21 +220,27 @@ class DynamicImporter:
         return False
 
     @classmethod
-    def check_dependencies(cls, class_obj: Type[Any], class_type: str) -> bool:
+    def check_dependencies(
+        cls,
+        class_obj: Type[Any],
+        class_type: str,
+        enabled_models: Optional[FrozenSet[str]] = None,
+    ) -> bool:
         """
         Check if class dependencies are met.
 
         Args:
             class_obj: Class object to check
             class_type: Type of class ('views' or 'models')
+            enabled_models: Already resolved enabled models, looked up if omitted
 
         Returns:
             True if dependencies are met, False otherwise
         """
         if class_type == "views" and hasattr(class_obj, "model"):
-            model_name = class_obj.model.__name__.lower()
-            enabled_models = cls.get_enabled_items("models")
-            return model_name in enabled_models
+            if enabled_models is None:
+                enabled_models = cls.get_enabled_items("models")
+            return class_obj.model.__name__.lower() in enabled_models
         return True
 
     @classmethod
@@ -220,37 +266,80 @@ class DynamicImporter:
         if not enabled_items:
             return
 
-        # Get module
-        module = cls.get_module(module_name)
+        # Resolve view dependencies once rather than per item
+        enabled_models = (
+            cls.get_enabled_items("models") if class_type == "views" else None
+        )
 
-        for item_name in enabled_items:
-            try:
-                class_name = cls.get_class_name(item_name, class_type)
+        yield from cls.resolve_classes(
+            module_name, class_type, enabled_items, enabled_models
+        )
 
-                # Check if class exists in module
-                if not hasattr(module, class_name):
-                    continue
+    @classmethod
+    @lru_cache(maxsize=None)
+    def resolve_classes(
+        cls,
+        module_name: str,
+        class_type: str,
+        enabled_items: FrozenSet[str],
+        enabled_models: Optional[FrozenSet[str]],
+    ) -> Tuple[Type[Any], ...]:
+        """
+        Resolve the classes for the given enabled items, with caching.
 
-                class_obj = getattr(module, class_name)
+        Results are keyed on the enabled items and models, so URL-conf
+        reloads with the same configuration skip the module reflection.
+        Classes are returned in dependency order (region, district, village).
 
-                # Validate class
-                if not cls.validate_class(class_obj, class_type):
-                    continue
+        Args:
+            module_name: Full module path to import from
+            class_type: Type of classes to import ('views' or 'models')
+            enabled_items: Enabled item names of ``class_type``
+            enabled_models: Enabled model names, used to check view dependencies
 
-                # Check dependencies
-                if not cls.check_dependencies(class_obj, class_type):
-                    continue
+        Returns:
+            Tuple of class objects that meet all requirements
 
-                yield class_obj
+        Raises:
+            DynamicImportError: If import fails or class not found
+        """
+        module = cls.get_module(module_name)
+        ordered_items = sorted(
+            enabled_items,
+            key=lambda name: (_ITEM_ORDER.get(name, len(_ITEM_ORDER)), name),
+        )
 
+        # Look up every candidate first, then filter them in one pass
+        candidates = []
+        for item_name in ordered_items:
+            try:
+                class_name = cls.get_class_name(item_name, class_type)
+            except Exception as e:
+                raise DynamicImportError(
+                    f"Failed to resolve class name for {item_name!r} "
+                    f"from {module_name}: {e}"
+                ) from e
+            class_obj = module.__dict__.get(class_name)
+            if class_obj is not None:
+                candidates.append((class_name, class_obj))
+
+        classes = []
+        for class_name, class_obj in candidates:
+            try:
+                if cls.validate_class(class_obj, class_type) and cls.check_dependencies(
+                    class_obj, class_type, enabled_models
+                ):
+                    classes.append(class_obj)
             except AttributeError as e:
                 raise DynamicImportError(
                     f"Failed to import {class_name} from {module_name}: {e}"
-                )
+                ) from e
             except Exception as e:
                 raise DynamicImportError(
                     f"Unexpected error importing {class_name} from {module_name}: {e}"
-                )
+                ) from e
+
+        return tuple(classes)
 
     @classmethod
     def is_model_enabled(cls, model_name: str) -> bool:
@@ -277,7 +366,9 @@ class DynamicImporter:
         """Clear all caches (useful for testing)."""
         cls.get_cache_config.cache_clear()
         cls.get_enabled_items.cache_clear()
+        cls.resolve_classes.cache_clear()
         cls._module_cache.clear()
+        cls._settings_cache.clear()
 
 
 # Backward compatibility functions (kept for existing code)
@@ -287,13 +378,13 @@ def get_uzbekistan_setting(setting_name: str, default: Any = None) -> Any:
 
 
 @lru_cache(maxsize=32)
-def get_enabled_models() -> Set[str]:
+def get_enabled_models() -> FrozenSet[str]:
     """Backward compatibility function."""
     return DynamicImporter.get_enabled_items("models")
 
 
 @lru_cache(maxsize=32)
-def get_enabled_views() -> Set[str]:
+def get_enabled_views() -> FrozenSet[str]:
     """Backward compatibility function."""
     return DynamicImporter.get_enabled_items("views")
 
@@ -306,9 +397,21 @@ def get_cache_settings() -> Dict[str, Any]:
         "enabled": cache_config.enabled,
         "timeout": cache_config.timeout,
         "key_prefix": cache_config.key_prefix,
+        "health_check": cache_config.health_check,
     }
 
 
+@receiver(setting_changed)
+def clear_caches_on_setting_changed(setting: str, **kwargs: Any) -> None:
+    """Drop cached configuration whenever the UZBEKISTAN setting changes."""
+    if setting != "UZBEKISTAN":
+        return
+    DynamicImporter.clear_cache()
+    get_enabled_models.cache_clear()
+    get_enabled_views.cache_clear()
+    get_cache_settings.cache_clear()
+
+
 def import_conditional_classes(
     module_name: str, class_type: str
 ) -> Generator[Type[Any], None, None]:
@@ -0,0 +1,213 @@
+import json
+import os
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.core.management.color import no_style
+from django.db import connection, transaction
+
+from uzbekistan.dynamic_importer import DynamicImporter
+from uzbekistan.models import Region, District, Village
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent.parent / "fixtures"
+
+# Directory for the parsed-fixture JSON side-files.
+FIXTURE_CACHE_DIR = FIXTURES_DIR
+
+# Number of rows sent to the database per INSERT statement.
+BATCH_SIZE = 1000
+
+# Outcomes reported by Command.populate()
+STATUS_POPULATED = "populated"
+STATUS_SKIPPED_EXISTING = "skipped_existing"
+STATUS_DISABLED = "disabled"
+
+
+class Command(BaseCommand):
+    help = "Populate regions and districts of Uzbekistan from the bundled fixtures."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Delete existing regions, districts and villages before populating.",
+        )
+
+    def handle(self, *args, **options):
+        result = self.populate(force=options["force"])
+        if options["verbosity"] < 1:
+            return
+
+        if result["status"] == STATUS_DISABLED:
+            self.stdout.write(
+                self.style.WARNING("Region model is disabled, nothing to populate.")
+            )
+        elif result["status"] == STATUS_SKIPPED_EXISTING:
+            self.stdout.write(
+                self.style.WARNING(
+                    "Regions already exist. Use --force to repopulate the data."
+                )
+            )
+        else:
+            counts = result["counts"]
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Successfully populated {counts['regions']} regions "
+                    f"and {counts['districts']} districts."
+                )
+            )
+
+    def populate(self, force: bool = False) -> dict:
+        """
+        Populate regions and districts from the bundled fixtures.
+
+        Args:
+            force: Delete existing rows before populating
+
+        Returns:
+            Dict with the run ``status`` (one of the ``STATUS_*`` constants)
+            and the inserted row ``counts`` per model
+        """
+        counts = {"regions": 0, "districts": 0}
+
+        if not DynamicImporter.is_model_enabled("region"):
+            return {"status": STATUS_DISABLED, "counts": counts}
+
+        if not force and Region.objects.exists():
+            return {"status": STATUS_SKIPPED_EXISTING, "counts": counts}
+
+        with transaction.atomic():
+            if force:
+                self.clear_tables()
+
+            regions = self.load_fixture("regions.yaml")
+            counts["regions"] = self.populate_regions(regions)
+            if DynamicImporter.is_model_enabled("district"):
+                counts["districts"] = self.populate_districts(regions)
+
+            self.reset_sequences()
+
+        return {"status": STATUS_POPULATED, "counts": counts}
+
+    @staticmethod
+    def clear_tables() -> None:
+        """
+        Delete all location rows, children first.
+
+        Rows are removed with one DELETE per table, bypassing Django's
+        deletion collector, so no per-row cascade lookups or delete signals.
+        """
+        for model in (Village, District, Region):
+            if DynamicImporter.is_model_enabled(model.__name__):
+                model.objects.all()._raw_delete(model.objects.db)
+
+    @staticmethod
+    def load_fixture(name: str) -> list[dict]:
+        """
+        Load a fixture file from the package fixtures directory.
+
+        Parsed rows are memoized in a JSON side-file keyed by the fixture's
+        mtime and size, so later runs skip the YAML parser. The side-file is
+        skipped silently if it cannot be written or the rows are not
+        JSON-serializable.
+
+        Args:
+            name: Fixture file name (e.g., 'regions.yaml')
+
+        Returns:
+            List of fixture rows in Django's serialization format
+        """
+        fixture_path = FIXTURES_DIR / name
+        cache_path = FIXTURE_CACHE_DIR / f"{fixture_path.stem}.cache.json"
+        stat = fixture_path.stat()
+        key = [stat.st_mtime_ns, stat.st_size]
+
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            if cached["key"] == key:
+                return cached["rows"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        # PyYAML is only needed on a cache miss, so import it here
+        import yaml
+
+        # Use the libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        # Hand the whole buffer to the parser instead of a layered file object
+        data = fixture_path.read_bytes()
+        rows = yaml.load(data, Loader=loader) or []  # nosec B506
+
+        # Write to a per-process temp file and swap it in, so concurrent runs
+        # (e.g. parallel test workers) never read a half-written side-file
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(
+                json.dumps({"key": key, "rows": rows}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            tmp_path.unlink(missing_ok=True)
+
+        return rows
+
+    def populate_regions(self, regions: list[dict]) -> int:
+        """
+        Insert regions missing from the database in batches.
+
+        Args:
+            regions: Rows of the regions fixture
+
+        Returns:
+            Number of regions inserted
+        """
+        existing = set(Region.objects.values_list("name_uz", flat=True))
+        regions = [
+            Region(pk=row["pk"], **row["fields"])
+            for row in regions
+            if row["fields"]["name_uz"] not in existing
+        ]
+        Region.objects.bulk_create(
+            regions, batch_size=BATCH_SIZE, ignore_conflicts=True
+        )
+        return len(regions)
+
+    def populate_districts(self, regions: list[dict]) -> int:
+        """
+        Insert districts missing from the database in batches.
+
+        District rows reference regions by fixture pk, which is mapped to the
+        region's name and then to its actual database pk, so districts attach
+        to the right region even if it was stored under a different pk.
+
+        Args:
+            regions: Rows of the regions fixture
+
+        Returns:
+            Number of districts inserted
+        """
+        fixture_region_names = {row["pk"]: row["fields"]["name_uz"] for row in regions}
+        region_by_name = dict(Region.objects.values_list("name_uz", "pk"))
+        existing = set(District.objects.values_list("name_uz", "region_id"))
+        districts = []
+        for row in self.load_fixture("districts.yaml"):
+            fields = dict(row["fields"])
+            region_id = region_by_name[fixture_region_names[fields.pop("region")]]
+            if (fields["name_uz"], region_id) in existing:
+                continue
+            districts.append(District(pk=row["pk"], region_id=region_id, **fields))
+
+        District.objects.bulk_create(
+            districts, batch_size=BATCH_SIZE, ignore_conflicts=True
+        )
+        return len(districts)
+
+    @staticmethod
+    def reset_sequences() -> None:
+        """Reset primary key sequences after inserting rows with explicit pks."""
+        statements = connection.ops.sequence_reset_sql(no_style(), [Region, District])
+        if statements:
+            with connection.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
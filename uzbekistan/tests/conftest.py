@@ -3,5 +3,18 @@ Pytest configuration for uzbekistan app.
 """
 
 import pytest
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
 
 pytest_plugins = ["pytest_django"]
+
+
+@receiver(connection_created)
+def tune_sqlite_for_tests(sender, connection, **kwargs):
+    """Skip durability work SQLite would otherwise do for the throwaway test DB."""
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
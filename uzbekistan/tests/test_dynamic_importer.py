@@ -1,3 +1,5 @@
+from unittest import mock
+
 from django.test import TestCase, override_settings
 from django.core.exceptions import ImproperlyConfigured
 
@@ -9,19 +11,13 @@ from uzbekistan.dynamic_importer import (
     get_cache_settings,
     import_conditional_classes,
     DynamicImportError,
+    CacheIncorrectlyConfigured,
     validate_configuration,
 )
 from uzbekistan.models import Region, District, Village
 
 
 class TestDynamicImporter(TestCase):
-    def setUp(self):
-        # Clear LRU caches
-        get_enabled_models.cache_clear()
-        get_enabled_views.cache_clear()
-        get_cache_settings.cache_clear()
-        DynamicImporter.clear_cache()
-
     @override_settings(UZBEKISTAN=None)
     def test_get_uzbekistan_setting_missing(self):
         """Test that missing UZBEKISTAN setting raises ImproperlyConfigured."""
@@ -35,6 +31,16 @@ class TestDynamicImporter(TestCase):
         result = get_uzbekistan_setting("nonexistent", default)
         self.assertEqual(result, default)
 
+    def test_get_uzbekistan_setting_is_cached(self):
+        """Test that settings lookups are cached until the setting changes."""
+        with override_settings(UZBEKISTAN={"use_authentication": True}):
+            self.assertTrue(get_uzbekistan_setting("use_authentication"))
+            self.assertIsNone(get_uzbekistan_setting("missing"))
+            self.assertEqual(
+                DynamicImporter._settings_cache["use_authentication"], True
+            )
+        self.assertFalse(get_uzbekistan_setting("use_authentication", False))
+
     def test_get_enabled_models(self):
         """Test getting enabled models from settings."""
         with override_settings(
@@ -42,6 +48,23 @@ class TestDynamicImporter(TestCase):
         ):
             enabled = get_enabled_models()
             self.assertEqual(enabled, {"region"})
+            self.assertIsInstance(enabled, frozenset)
+
+    def test_setting_change_clears_caches(self):
+        """Test that overriding UZBEKISTAN invalidates cached lookups."""
+        self.assertIn("district", get_enabled_models())
+        self.assertEqual(get_cache_settings()["timeout"], 3600)
+        with override_settings(
+            UZBEKISTAN={
+                "models": {"region": True},
+                "cache": {"enabled": False, "timeout": 60},
+            }
+        ):
+            self.assertEqual(get_enabled_models(), {"region"})
+            self.assertEqual(get_cache_settings()["timeout"], 60)
+            self.assertFalse(DynamicImporter.is_model_enabled("district"))
+        self.assertIn("district", get_enabled_models())
+        self.assertTrue(DynamicImporter.is_model_enabled("district"))
 
     def test_get_enabled_views(self):
         """Test getting enabled views from settings."""
@@ -118,3 +141,78 @@ class TestDynamicImporter(TestCase):
         """Test cache clearing functionality."""
         # This should not raise any exception
         DynamicImporter.clear_cache()
+
+    def test_get_class_name(self):
+        """Test class name resolution for known and unknown items."""
+        self.assertEqual(
+            DynamicImporter.get_class_name("region", "views"), "RegionListAPIView"
+        )
+        self.assertEqual(DynamicImporter.get_class_name("village", "models"), "Village")
+        self.assertEqual(
+            DynamicImporter.get_class_name("custom", "views"), "CustomListAPIView"
+        )
+        with self.assertRaises(ValueError):
+            DynamicImporter.get_class_name("region", "serializers")
+
+    @override_settings(
+        UZBEKISTAN={
+            "models": {"region": True},
+            "cache": {"enabled": True, "timeout": 60},
+        }
+    )
+    def test_validate_configuration_skips_cache_io_by_default(self):
+        """Test that the cache health check is opt-in."""
+        with mock.patch("uzbekistan.dynamic_importer.cache") as cache_mock:
+            validate_configuration()
+        cache_mock.set.assert_not_called()
+        cache_mock.get.assert_not_called()
+
+    @override_settings(
+        UZBEKISTAN={
+            "models": {"region": True},
+            "cache": {"enabled": True, "timeout": 60, "health_check": True},
+        }
+    )
+    def test_validate_configuration_with_cache_health_check(self):
+        """Test that a broken cache fails the opt-in health check."""
+        with mock.patch("uzbekistan.dynamic_importer.cache") as cache_mock:
+            cache_mock.get.return_value = None
+            with self.assertRaises(CacheIncorrectlyConfigured):
+                validate_configuration()
+        cache_mock.set.assert_called_once()
+
+    def test_import_conditional_classes_is_cached(self):
+        """Test that repeated imports reuse the resolved classes."""
+        with override_settings(
+            UZBEKISTAN={"views": {"region": True}, "models": {"region": True}}
+        ):
+            first = list(import_conditional_classes("uzbekistan.views", "views"))
+            with mock.patch.object(DynamicImporter, "get_module") as get_module:
+                second = list(import_conditional_classes("uzbekistan.views", "views"))
+            get_module.assert_not_called()
+            self.assertEqual(first, second)
+
+    def test_import_conditional_classes_dependency_order(self):
+        """Test that classes are returned in dependency order."""
+        classes = list(import_conditional_classes("uzbekistan.views", "views"))
+        self.assertEqual([cls.model for cls in classes], [Region, District, Village])
+
+    def test_resolve_classes_error_names_item(self):
+        """Test that resolution errors name the failing item."""
+        with self.assertRaises(DynamicImportError) as context:
+            DynamicImporter.resolve_classes(
+                "uzbekistan.views", "serializers", frozenset({"region"}), None
+            )
+        self.assertIn("'region'", str(context.exception))
+        self.assertIsInstance(context.exception.__cause__, ValueError)
+
+    def test_resolve_classes_error_names_class(self):
+        """Test that validation errors name the failing class."""
+        with mock.patch.object(
+            DynamicImporter, "validate_class", side_effect=AttributeError("boom")
+        ):
+            with self.assertRaises(DynamicImportError) as context:
+                DynamicImporter.resolve_classes(
+                    "uzbekistan.views", "views", frozenset({"region"}), None
+                )
+        self.assertIn("RegionListAPIView", str(context.exception))
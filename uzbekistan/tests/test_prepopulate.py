@@ -0,0 +1,168 @@
+"""
+Tests for the populate_uzbekistan management command.
+"""
+
+import shutil
+from datetime import datetime
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from uzbekistan.management.commands.populate_uzbekistan import (
+    Command,
+    FIXTURES_DIR,
+    STATUS_DISABLED,
+    STATUS_POPULATED,
+    STATUS_SKIPPED_EXISTING,
+)
+from uzbekistan.models import Region, District, Village
+
+
+class TestPrepopulateCommand(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Keep parsed-fixture side-files out of the package source tree
+        cache_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cache_dir.cleanup)
+        patcher = mock.patch(
+            f"{Command.__module__}.FIXTURE_CACHE_DIR", Path(cache_dir.name)
+        )
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+    def test_populate_command(self):
+        result = Command().populate()
+        self.assertEqual(result["status"], STATUS_POPULATED)
+        self.assertEqual(result["counts"], {"regions": 14, "districts": 209})
+        self.assertEqual(Region.objects.count(), 14)
+        self.assertEqual(District.objects.count(), 209)
+        self.assertEqual(
+            District.objects.get(pk=15).region.name_uz,
+            "Qoraqalpog‘iston Respublikasi",
+        )
+
+    def test_populate_command_output(self):
+        out = StringIO()
+        call_command("populate_uzbekistan", stdout=out)
+        self.assertIn("Successfully populated 14 regions", out.getvalue())
+
+    def test_populate_command_quiet(self):
+        out = StringIO()
+        call_command("populate_uzbekistan", verbosity=0, stdout=out)
+        self.assertEqual(out.getvalue(), "")
+        self.assertEqual(Region.objects.count(), 14)
+
+    def test_populate_command_batches_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            Command().populate()
+
+        statements = [query["sql"].split()[0] for query in context.captured_queries]
+        # One savepoint for the whole run, not one per get_or_create
+        self.assertEqual(statements.count("SAVEPOINT"), 1)
+        # Rows are inserted in batches rather than one by one
+        self.assertLess(statements.count("INSERT"), 10)
+        self.assertEqual(District.objects.count(), 209)
+
+    def test_populate_command_without_force(self):
+        Region.objects.create(
+            name_uz="Toshkent", name_oz="Тошкент", name_ru="Ташкент", name_en="Tashkent"
+        )
+        result = Command().populate()
+        self.assertEqual(result["status"], STATUS_SKIPPED_EXISTING)
+        self.assertEqual(Region.objects.count(), 1)
+
+    def test_populate_command_with_force(self):
+        Region.objects.create(
+            name_uz="Toshkent", name_oz="Тошкент", name_ru="Ташкент", name_en="Tashkent"
+        )
+        result = Command().populate(force=True)
+        self.assertEqual(result["status"], STATUS_POPULATED)
+        self.assertEqual(Region.objects.count(), 14)
+        self.assertFalse(Region.objects.filter(name_uz="Toshkent").exists())
+
+    def test_populate_command_with_force_clears_villages(self):
+        Command().populate()
+        Village.objects.create(
+            name_uz="Mirobod",
+            name_oz="Миробод",
+            name_ru="Мирабад",
+            district=District.objects.first(),
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            Command().populate(force=True)
+
+        deletes = [
+            query
+            for query in context.captured_queries
+            if query["sql"].startswith("DELETE")
+        ]
+        self.assertEqual(len(deletes), 3)
+        self.assertFalse(Village.objects.exists())
+        self.assertEqual(Region.objects.count(), 14)
+        self.assertEqual(District.objects.count(), 209)
+
+    @override_settings(
+        UZBEKISTAN={
+            "models": {"region": False, "district": False, "village": False},
+            "views": {"region": False},
+        }
+    )
+    def test_populate_disabled_setting(self):
+        result = Command().populate()
+        self.assertEqual(result["status"], STATUS_DISABLED)
+        self.assertFalse(Region.objects.exists())
+
+    def test_populate_districts_resolves_regions_by_name(self):
+        command = Command()
+        regions = command.load_fixture("regions.yaml")
+        Region.objects.bulk_create(
+            Region(pk=row["pk"] + 1000, **row["fields"]) for row in regions
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            command.populate_districts(regions)
+
+        region_selects = [
+            query
+            for query in context.captured_queries
+            if query["sql"].startswith("SELECT") and '"regions"' in query["sql"]
+        ]
+        self.assertEqual(len(region_selects), 1)
+        self.assertEqual(District.objects.get(pk=15).region_id, 1001)
+
+    def test_load_fixture_uses_cached_rows(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            fixtures_dir = Path(tmp)
+            shutil.copy(FIXTURES_DIR / "regions.yaml", fixtures_dir)
+            with mock.patch(
+                f"{Command.__module__}.FIXTURES_DIR", fixtures_dir
+            ), mock.patch(f"{Command.__module__}.FIXTURE_CACHE_DIR", fixtures_dir):
+                rows = Command.load_fixture("regions.yaml")
+                self.assertTrue((fixtures_dir / "regions.cache.json").exists())
+
+                with mock.patch("yaml.load") as yaml_load:
+                    self.assertEqual(Command.load_fixture("regions.yaml"), rows)
+                yaml_load.assert_not_called()
+
+                # Touching the fixture invalidates the memoized rows
+                with open(fixtures_dir / "regions.yaml", "a", encoding="utf-8") as f:
+                    f.write("\n")
+                with mock.patch("yaml.load", return_value=rows) as yaml_load:
+                    Command.load_fixture("regions.yaml")
+                yaml_load.assert_called_once()
+
+    def test_load_fixture_skips_unserializable_rows(self):
+        rows = [{"pk": 1, "fields": {"updated": datetime(2024, 1, 1)}}]
+        with tempfile.TemporaryDirectory() as tmp, mock.patch(
+            f"{Command.__module__}.FIXTURE_CACHE_DIR", Path(tmp)
+        ), mock.patch("yaml.load", return_value=rows):
+            self.assertEqual(Command.load_fixture("regions.yaml"), rows)
+            self.assertEqual(list(Path(tmp).iterdir()), [])
@@ -2,22 +2,191 @@
 Tests for uzbekistan app views.
 """
 
+from types import MappingProxyType
+
 import pytest
-from django.urls import reverse
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse, reverse_lazy
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
 from uzbekistan.models import Region, District, Village
+from uzbekistan.views import RegionListAPIView, DistrictListAPIView
+
+REGION_LIST_URL = reverse_lazy("region-list")
+
+# Shared by several overrides, so freeze every level against mutation
+CACHE_ENABLED_SETTINGS = MappingProxyType(
+    {
+        "models": MappingProxyType({"region": True, "district": True, "village": True}),
+        "views": MappingProxyType({"region": True, "district": True, "village": True}),
+        "cache": MappingProxyType(
+            {"enabled": True, "timeout": 60, "key_prefix": "uzbekistan"}
+        ),
+    }
+)
+
+
+def _cache_key(view_cls, params=None, **kwargs):
+    """Return the cache key ``view_cls`` builds for a GET with ``params``."""
+    request = Request(APIRequestFactory().get("/", params))
+    return view_cls()._generate_cache_key(request, kwargs)
 
 
 class TestRegionAPI(APITestCase):
-    def setUp(self):
-        self.region = Region.objects.create(
+    url = REGION_LIST_URL
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.region = Region.objects.create(
             name_uz="Toshkent", name_oz="Тошкент", name_ru="Ташкент", name_en="Tashkent"
         )
-        self.url = reverse("region-list")
 
     def test_list_regions(self):
-        response = self.client.get(self.url)
+        # Unauthenticated access is configured, so listing is a single query
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["name_uz"], "Toshkent")
+
+    @override_settings(UZBEKISTAN=CACHE_ENABLED_SETTINGS)
+    def test_list_regions_with_cache(self):
+        self.addCleanup(cache.clear)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(cache.get(_cache_key(RegionListAPIView)), response.data)
+
+        # A cached response must not touch the database; call the view
+        # directly to skip middleware and URL resolution
+        request = APIRequestFactory().get(self.url)
+        with self.assertNumQueries(0):
+            cached_response = RegionListAPIView.as_view()(request)
+        self.assertEqual(cached_response.data, response.data)
+
+
+@override_settings(UZBEKISTAN=CACHE_ENABLED_SETTINGS)
+class TestLocationViewCache(SimpleTestCase):
+    """Cache hits are served without the database, which SimpleTestCase forbids."""
+
+    def setUp(self):
+        self.addCleanup(cache.clear)
+        self.factory = APIRequestFactory()
+
+    def test_district_list_served_from_cache(self):
+        payload = [{"id": 1, "name_uz": "Yunusobod", "region": 1}]
+        cache.set(_cache_key(DistrictListAPIView, region_id=1), payload)
+
+        request = self.factory.get(reverse("district-list", kwargs={"region_id": 1}))
+        response = DistrictListAPIView.as_view()(request, region_id=1)
+        self.assertEqual(response.data, payload)
+
+
+class TestDistrictAPI(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.region = Region.objects.create(
+            name_uz="Toshkent", name_oz="Тошкент", name_ru="Ташкент", name_en="Tashkent"
+        )
+        cls.district = District.objects.create(
+            name_uz="Yunusobod",
+            name_oz="Юнусобод",
+            name_ru="Юнусабад",
+            name_en="Yunusabad",
+            region=cls.region,
+        )
+        cls.url = reverse("district-list", kwargs={"region_id": cls.region.id})
+
+    def test_list_districts(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["name_uz"], "Yunusobod")
+        self.assertEqual(response.data[0]["region"], self.region.id)
+
+    @override_settings(UZBEKISTAN=CACHE_ENABLED_SETTINGS)
+    def test_list_districts_with_cache(self):
+        self.addCleanup(cache.clear)
+        response = self.client.get(self.url, {"name": "Yunus"})
+        self.assertEqual(len(response.data), 1)
+
+        cache_key = _cache_key(
+            DistrictListAPIView, {"name": "Yunus"}, region_id=self.region.id
+        )
+        self.assertEqual(cache.get(cache_key), response.data)
+
+
+class TestVillageAPI(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.region = Region.objects.create(
+            name_uz="Toshkent", name_oz="Тошкент", name_ru="Ташкент", name_en="Tashkent"
+        )
+        # Stage each level in one INSERT; parents first for the FKs. Not every
+        # backend returns pks from bulk inserts, so re-fetch the rows.
+        District.objects.bulk_create(
+            [
+                District(
+                    name_uz="Yunusobod",
+                    name_oz="Юнусобод",
+                    name_ru="Юнусабад",
+                    name_en="Yunusabad",
+                    region=cls.region,
+                )
+            ]
+        )
+        cls.district = District.objects.get(name_uz="Yunusobod")
+        Village.objects.bulk_create(
+            [
+                Village(
+                    name_uz="Mirobod",
+                    name_oz="Миробод",
+                    name_ru="Мирабад",
+                    district=cls.district,
+                )
+            ]
+        )
+        cls.village = Village.objects.get(name_uz="Mirobod")
+        cls.url = reverse("village-list", kwargs={"district_id": cls.district.id})
+
+    def test_list_villages(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["name_uz"], "Mirobod")
+        self.assertEqual(response.data[0]["district"], self.district.id)
+
+
+class TestCacheKey(SimpleTestCase):
+    def test_cache_key_with_url_kwargs_and_query_params(self):
+        # Used to raise ValueError by unpacking dict keys as (key, value) pairs
+        key = _cache_key(DistrictListAPIView, {"name": "Yunus"}, region_id=1)
+        self.assertTrue(key.startswith("uzbekistan_DistrictListAPIView_"))
+
+    def test_cache_key_is_order_independent(self):
+        self.assertEqual(
+            _cache_key(
+                DistrictListAPIView,
+                {"name": "Yunus", "region_name": "Tosh"},
+                region_id=1,
+            ),
+            _cache_key(
+                DistrictListAPIView,
+                {"region_name": "Tosh", "name": "Yunus"},
+                region_id=1,
+            ),
+        )
+
+    def test_cache_key_differs_per_request(self):
+        self.assertNotEqual(
+            _cache_key(DistrictListAPIView, region_id=1),
+            _cache_key(DistrictListAPIView, region_id=2),
+        )
+        self.assertNotEqual(
+            _cache_key(DistrictListAPIView, {"name": "Yunus"}, region_id=1),
+            _cache_key(DistrictListAPIView, {"name": "Chil"}, region_id=1),
+        )